@@ -580,6 +580,67 @@ finally:
     return output;
 }
 
+static PyObject *ZstdCompressor_compress_into(ZstdCompressor *self,
+                                              PyObject *args,
+                                              PyObject *kwargs) {
+    ZstdModuleState *st = zstd_state_from_obj((PyObject *)self);
+    static char *kwlist[] = {"data", "output", NULL};
+
+    Py_buffer source;
+    Py_buffer dest;
+    PyObject *result = NULL;
+    size_t zresult;
+    ZSTD_outBuffer outBuffer;
+    ZSTD_inBuffer inBuffer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*w*:compress_into",
+                                     kwlist, &source, &dest)) {
+        return NULL;
+    }
+
+    ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
+
+    zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, source.len);
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(zstd_error(st), "error setting source size: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+
+    inBuffer.src = source.buf;
+    inBuffer.size = source.len;
+    inBuffer.pos = 0;
+
+    outBuffer.dst = dest.buf;
+    outBuffer.size = dest.len;
+    outBuffer.pos = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+        zresult =
+            ZSTD_compressStream2(self->cctx, &outBuffer, &inBuffer, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
+
+        if (ZSTD_isError(zresult)) {
+        PyErr_Format(zstd_error(st), "cannot compress: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+    else if (zresult) {
+        /* Leave the context ready for the next operation. */
+        ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
+        PyErr_SetString(zstd_error(st),
+                        "output buffer is too small to hold compressed data");
+        goto finally;
+    }
+
+    result = PyLong_FromSize_t(outBuffer.pos);
+
+finally:
+    PyBuffer_Release(&dest);
+    PyBuffer_Release(&source);
+    return result;
+}
+
 static ZstdCompressionObj *ZstdCompressor_compressobj(ZstdCompressor *self,
                                                       PyObject *args,
                                                       PyObject *kwargs) {
@@ -1523,6 +1584,8 @@ static PyMethodDef ZstdCompressor_methods[] = {
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"compress", (PyCFunction)ZstdCompressor_compress,
      METH_VARARGS | METH_KEYWORDS, NULL},
+    {"compress_into", (PyCFunction)ZstdCompressor_compress_into,
+     METH_VARARGS | METH_KEYWORDS, NULL},
     {"compressobj", (PyCFunction)ZstdCompressor_compressobj,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"copy_stream", (PyCFunction)ZstdCompressor_copy_stream,
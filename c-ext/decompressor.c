@@ -397,6 +397,64 @@ finally:
     return result;
 }
 
+static PyObject *Decompressor_decompress_into(ZstdDecompressor *self,
+                                              PyObject *args,
+                                              PyObject *kwargs) {
+    static char *kwlist[] = {"data", "output", NULL};
+
+    ZstdModuleState *st = zstd_state_from_obj((PyObject *)self);
+    Py_buffer source;
+    Py_buffer dest;
+    PyObject *result = NULL;
+    size_t zresult;
+    ZSTD_outBuffer outBuffer;
+    ZSTD_inBuffer inBuffer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*w*:decompress_into",
+                                     kwlist, &source, &dest)) {
+        return NULL;
+    }
+
+    if (ensure_dctx(self, 1)) {
+        goto finally;
+    }
+
+    outBuffer.dst = dest.buf;
+    outBuffer.size = dest.len;
+    outBuffer.pos = 0;
+
+    inBuffer.src = source.buf;
+    inBuffer.size = source.len;
+    inBuffer.pos = 0;
+
+    Py_BEGIN_ALLOW_THREADS zresult =
+        ZSTD_decompressStream(self->dctx, &outBuffer, &inBuffer);
+    Py_END_ALLOW_THREADS
+
+        if (ZSTD_isError(zresult)) {
+        PyErr_Format(zstd_error(st), "decompression error: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+    else if (zresult && outBuffer.pos == outBuffer.size) {
+        PyErr_SetString(zstd_error(st),
+                        "output buffer is too small to hold decompressed data");
+        goto finally;
+    }
+    else if (zresult) {
+        PyErr_SetString(zstd_error(st),
+                        "decompression error: did not decompress full frame");
+        goto finally;
+    }
+
+    result = PyLong_FromSize_t(outBuffer.pos);
+
+finally:
+    PyBuffer_Release(&dest);
+    PyBuffer_Release(&source);
+    return result;
+}
+
 static ZstdDecompressionObj *Decompressor_decompressobj(ZstdDecompressor *self,
                                                         PyObject *args,
                                                         PyObject *kwargs) {
@@ -1725,6 +1783,8 @@ static PyMethodDef Decompressor_methods[] = {
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"decompress", (PyCFunction)Decompressor_decompress,
      METH_VARARGS | METH_KEYWORDS, NULL},
+    {"decompress_into", (PyCFunction)Decompressor_decompress_into,
+     METH_VARARGS | METH_KEYWORDS, NULL},
     {"decompressobj", (PyCFunction)Decompressor_decompressobj,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"read_to_iter", (PyCFunction)Decompressor_read_to_iter,
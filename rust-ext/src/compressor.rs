@@ -18,7 +18,12 @@ use {
         zstd_safe::CCtx,
         ZstdError,
     },
-    pyo3::{buffer::PyBuffer, exceptions::PyValueError, prelude::*, types::PyBytes},
+    pyo3::{
+        buffer::PyBuffer,
+        exceptions::{PyTypeError, PyValueError},
+        prelude::*,
+        types::PyBytes,
+    },
     std::sync::Arc,
 };
 
@@ -176,6 +181,69 @@ impl ZstdCompressor {
         Ok(PyBytes::new(py, &data))
     }
 
+    #[pyo3(signature = (data, output))]
+    fn compress_into(
+        &self,
+        py: Python,
+        data: PyBuffer<u8>,
+        output: PyBuffer<u8>,
+    ) -> PyResult<usize> {
+        if output.readonly() {
+            return Err(PyTypeError::new_err("output must be a writable buffer"));
+        }
+
+        let source: &[u8] =
+            unsafe { std::slice::from_raw_parts(data.buf_ptr() as *const _, data.len_bytes()) };
+        let dest: &mut [u8] = unsafe {
+            std::slice::from_raw_parts_mut(output.buf_ptr() as *mut _, output.len_bytes())
+        };
+
+        let cctx = &self.cctx;
+
+        cctx.reset();
+        cctx.set_pledged_source_size(source.len() as _)
+            .or_else(|msg| {
+                Err(ZstdError::new_err(format!(
+                    "error setting source size: {}",
+                    msg
+                )))
+            })?;
+
+        let (zresult, written) = py
+            .allow_threads(|| {
+                let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+                    src: source.as_ptr() as *const _,
+                    size: source.len(),
+                    pos: 0,
+                };
+
+                let mut out_buffer = zstd_sys::ZSTD_outBuffer {
+                    dst: dest.as_mut_ptr() as *mut _,
+                    size: dest.len(),
+                    pos: 0,
+                };
+
+                cctx.compress_buffers(
+                    &mut out_buffer,
+                    &mut in_buffer,
+                    zstd_sys::ZSTD_EndDirective::ZSTD_e_end,
+                )
+                .map(|zresult| (zresult, out_buffer.pos))
+            })
+            .or_else(|msg| Err(ZstdError::new_err(format!("cannot compress: {}", msg))))?;
+
+        if zresult != 0 {
+            // Leave the context ready for the next operation.
+            cctx.reset();
+
+            return Err(ZstdError::new_err(
+                "output buffer is too small to hold compressed data",
+            ));
+        }
+
+        Ok(written)
+    }
+
     #[pyo3(signature = (size=None, chunk_size=None))]
     fn chunker(
         &self,
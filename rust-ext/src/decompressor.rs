@@ -14,7 +14,7 @@ use {
     },
     pyo3::{
         buffer::PyBuffer,
-        exceptions::{PyMemoryError, PyValueError},
+        exceptions::{PyMemoryError, PyTypeError, PyValueError},
         prelude::*,
         types::{PyBytes, PyList},
         wrap_pyfunction,
@@ -244,6 +244,49 @@ impl ZstdDecompressor {
         }
     }
 
+    #[pyo3(signature = (data, output))]
+    fn decompress_into(
+        &mut self,
+        py: Python,
+        data: PyBuffer<u8>,
+        output: PyBuffer<u8>,
+    ) -> PyResult<usize> {
+        if output.readonly() {
+            return Err(PyTypeError::new_err("output must be a writable buffer"));
+        }
+
+        self.setup_dctx(py, true)?;
+
+        let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+            src: data.buf_ptr(),
+            size: data.len_bytes(),
+            pos: 0,
+        };
+
+        let mut out_buffer = zstd_sys::ZSTD_outBuffer {
+            dst: output.buf_ptr(),
+            size: output.len_bytes(),
+            pos: 0,
+        };
+
+        let zresult = self
+            .dctx
+            .decompress_buffers(&mut out_buffer, &mut in_buffer)
+            .map_err(|msg| ZstdError::new_err(format!("decompression error: {}", msg)))?;
+
+        if zresult != 0 && out_buffer.pos == out_buffer.size {
+            Err(ZstdError::new_err(
+                "output buffer is too small to hold decompressed data",
+            ))
+        } else if zresult != 0 {
+            Err(ZstdError::new_err(
+                "decompression error: did not decompress full frame",
+            ))
+        } else {
+            Ok(out_buffer.pos)
+        }
+    }
+
     fn decompress_content_dict_chain<'p>(
         &self,
         py: Python<'p>,
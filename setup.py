@@ -7,7 +7,9 @@
 
 from __future__ import print_function
 
+import mmap
 import os
+import re
 import sys
 
 from setuptools import setup
@@ -42,34 +44,32 @@ sys.path.insert(0, ".")
 
 import setup_zstd  # noqa: E402
 
-SUPPORT_LEGACY = False
-SYSTEM_ZSTD = False
-WARNINGS_AS_ERRORS = False
-C_BACKEND = True
-RUST_BACKEND = False
-
-if os.environ.get("ZSTD_WARNINGS_AS_ERRORS", ""):
-    WARNINGS_AS_ERRORS = True
-
-if "--legacy" in sys.argv:
-    SUPPORT_LEGACY = True
-    sys.argv.remove("--legacy")
-
-if "--system-zstd" in sys.argv:
-    SYSTEM_ZSTD = True
-    sys.argv.remove("--system-zstd")
-
-if "--warnings-as-errors" in sys.argv:
-    WARNINGS_AS_ERRORS = True
-    sys.argv.remove("--warning-as-errors")
-
-if "--no-c-backend" in sys.argv:
-    C_BACKEND = False
-    sys.argv.remove("--no-c-backend")
-
-if "--rust-backend" in sys.argv:
-    RUST_BACKEND = True
-    sys.argv.remove("--rust-backend")
+# Build options accepted as command line arguments. They are removed from
+# sys.argv so setuptools doesn't see them.
+FLAG_ARGUMENTS = {
+    "--legacy": "SUPPORT_LEGACY",
+    "--system-zstd": "SYSTEM_ZSTD",
+    "--warnings-as-errors": "WARNINGS_AS_ERRORS",
+    "--no-c-backend": "NO_C_BACKEND",
+    "--rust-backend": "RUST_BACKEND",
+}
+
+flags = set()
+argv = []
+for arg in sys.argv:
+    if arg in FLAG_ARGUMENTS:
+        flags.add(FLAG_ARGUMENTS[arg])
+    else:
+        argv.append(arg)
+sys.argv = argv
+
+SUPPORT_LEGACY = "SUPPORT_LEGACY" in flags
+SYSTEM_ZSTD = "SYSTEM_ZSTD" in flags
+WARNINGS_AS_ERRORS = "WARNINGS_AS_ERRORS" in flags or bool(
+    os.environ.get("ZSTD_WARNINGS_AS_ERRORS", "")
+)
+C_BACKEND = "NO_C_BACKEND" not in flags
+RUST_BACKEND = "RUST_BACKEND" in flags
 
 # Code for obtaining the Extension instance is in its own module to
 # facilitate reuse in other projects.
@@ -89,13 +89,13 @@ if RUST_BACKEND:
 
 version = None
 
-with open("c-ext/hyperlight-zstandard.h", "r") as fh:
-    for line in fh:
-        if not line.startswith("#define HYPERLIGHT_ZSTANDARD_VERSION"):
-            continue
-
-        version = line.split()[2][1:-1]
-        break
+with open("c-ext/hyperlight-zstandard.h", "rb") as fh:
+    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        m = re.search(
+            rb'^#define HYPERLIGHT_ZSTANDARD_VERSION "([^"]+)"', mm, re.M
+        )
+        if m:
+            version = m.group(1).decode("ascii")
 
 if not version:
     raise Exception(
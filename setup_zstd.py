@@ -24,6 +24,20 @@ ext_sources = [
     "c-ext/backend_c.c",
 ]
 
+# Values accepted by the ZSTD_TARGET_ARCH environment variable and the
+# compiler arguments they map to for each compiler type. Binaries built with
+# these will not run on CPUs lacking the targeted instruction set extensions.
+target_arch_args = {
+    "x86-64-v3": {
+        "unix": ["-march=x86-64-v3", "-mtune=generic"],
+        "mingw32": ["-march=x86-64-v3", "-mtune=generic"],
+        "msvc": ["/arch:AVX2"],
+    },
+    "armv8.2-a": {
+        "unix": ["-march=armv8.2-a+crypto"],
+    },
+}
+
 
 def get_c_extension(
     support_legacy=False,
@@ -113,6 +127,16 @@ def get_c_extension(
     local_include_dirs = [os.path.relpath(p, root) for p in local_include_dirs]
     depends = [os.path.relpath(p, root) for p in depends]
 
+    target_arch = os.environ.get("ZSTD_TARGET_ARCH")
+    if target_arch:
+        try:
+            extra_args.extend(target_arch_args[target_arch][compiler_type])
+        except KeyError:
+            raise Exception(
+                "unsupported ZSTD_TARGET_ARCH for %s compiler: %s"
+                % (compiler_type, target_arch)
+            )
+
     if "ZSTD_EXTRA_COMPILER_ARGS" in os.environ:
         extra_args.extend(
             distutils.util.split_quoted(os.environ["ZSTD_EXTRA_COMPILER_ARGS"])
@@ -283,3 +283,43 @@ class TestCompressor_compress(unittest.TestCase):
                 write_dict_id=True,
                 threads=2,
             )
+
+
+class TestCompressor_compress_into(unittest.TestCase):
+    def test_simple(self):
+        cctx = zstd.ZstdCompressor(level=1)
+        source = b"foobar" * 8192
+        expected = cctx.compress(source)
+
+        output = bytearray(len(expected) + 32)
+        written = cctx.compress_into(source, output)
+        self.assertEqual(written, len(expected))
+        self.assertEqual(bytes(output[:written]), expected)
+
+    def test_memoryview(self):
+        cctx = zstd.ZstdCompressor()
+        expected = cctx.compress(b"foo" * 1024)
+
+        backing = bytearray(1024)
+        written = cctx.compress_into(b"foo" * 1024, memoryview(backing)[8:])
+        self.assertEqual(bytes(backing[8 : 8 + written]), expected)
+
+    def test_readonly_output(self):
+        cctx = zstd.ZstdCompressor()
+
+        with self.assertRaises(TypeError):
+            cctx.compress_into(b"foo", b"\x00" * 64)
+
+    def test_output_too_small(self):
+        cctx = zstd.ZstdCompressor()
+        source = b"foobar" * 8192
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "output buffer is too small"
+        ):
+            cctx.compress_into(source, bytearray(8))
+
+        # The compressor remains usable after the failure.
+        output = bytearray(1024)
+        written = cctx.compress_into(source, output)
+        self.assertEqual(bytes(output[:written]), cctx.compress(source))
@@ -224,3 +224,59 @@ class TestDecompressor_decompress(unittest.TestCase):
             zstd.ZstdError, "4 bytes of unused data, which is disallowed"
         ):
             dctx.decompress(frame + b"junk", allow_extra_data=False)
+
+
+class TestDecompressor_decompress_into(unittest.TestCase):
+    def test_simple(self):
+        source = b"foobar" * 8192
+        frame = zstd.ZstdCompressor().compress(source)
+
+        dctx = zstd.ZstdDecompressor()
+        output = bytearray(len(source))
+        self.assertEqual(dctx.decompress_into(frame, output), len(source))
+        self.assertEqual(output, source)
+
+    def test_no_content_size_in_frame(self):
+        cctx = zstd.ZstdCompressor(write_content_size=False)
+        frame = cctx.compress(b"foobar" * 256)
+
+        dctx = zstd.ZstdDecompressor()
+        output = bytearray(4096)
+        written = dctx.decompress_into(frame, memoryview(output))
+        self.assertEqual(bytes(output[:written]), b"foobar" * 256)
+
+    def test_empty(self):
+        frame = zstd.ZstdCompressor().compress(b"")
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(dctx.decompress_into(frame, bytearray(16)), 0)
+
+    def test_readonly_output(self):
+        frame = zstd.ZstdCompressor().compress(b"foo")
+
+        dctx = zstd.ZstdDecompressor()
+        with self.assertRaises(TypeError):
+            dctx.decompress_into(frame, b"\x00" * 16)
+
+    def test_output_too_small(self):
+        source = b"foobar" * 8192
+        frame = zstd.ZstdCompressor().compress(source)
+
+        dctx = zstd.ZstdDecompressor()
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "output buffer is too small"
+        ):
+            dctx.decompress_into(frame, bytearray(len(source) - 1))
+
+        output = bytearray(len(source))
+        self.assertEqual(dctx.decompress_into(frame, output), len(source))
+        self.assertEqual(output, source)
+
+    def test_incomplete_frame(self):
+        frame = zstd.ZstdCompressor().compress(b"foobar" * 8192)
+
+        dctx = zstd.ZstdDecompressor()
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "did not decompress full frame"
+        ):
+            dctx.decompress_into(frame[:-4], bytearray(65536))
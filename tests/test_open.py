@@ -1,10 +1,13 @@
 import io
 import os
+import pathlib
 import tempfile
 import unittest
 
 import zstandard as zstd
 
+from .common import CustomBytesIO
+
 
 class TestOpen(unittest.TestCase):
     def test_write_binary_fileobj(self):
@@ -118,3 +121,67 @@ class TestOpen(unittest.TestCase):
 
             fh.close()
             self.assertTrue(fh.closed)
+
+    def test_append_filename(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = os.path.join(td, "testfile")
+
+            with zstd.open(p, "w") as fh:
+                fh.write("foo\n")
+
+            with zstd.open(p, "a") as fh:
+                fh.write("bar\n")
+
+            with zstd.open(p, "rb") as fh:
+                self.assertEqual(fh.read(), b"foo\nbar\n")
+
+    def test_invalid_mode(self):
+        with self.assertRaisesRegex(ValueError, "Invalid mode: 'rw'"):
+            zstd.open(io.BytesIO(), "rw")
+
+    def test_read_size(self):
+        cctx = zstd.ZstdCompressor()
+        frame = cctx.compress(b"foo" * 1024)
+
+        buffer = CustomBytesIO(frame)
+        with zstd.open(buffer, "rb", read_size=1) as fh:
+            self.assertEqual(fh.read(), b"foo" * 1024)
+
+        self.assertGreaterEqual(buffer._read_count, len(frame))
+
+    def test_write_size(self):
+        buffer = CustomBytesIO()
+
+        with zstd.open(buffer, "wb", write_size=1) as fh:
+            fh.write(b"foo" * 1024)
+
+        self.assertGreater(buffer._write_count, 1)
+
+    def test_text_chunk_size(self):
+        cctx = zstd.ZstdCompressor()
+        buffer = io.BytesIO(cctx.compress(b"foo\n" * 1024))
+
+        with zstd.open(buffer, "r") as fh:
+            self.assertEqual(
+                fh._CHUNK_SIZE, zstd.DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE
+            )
+            self.assertEqual(fh.read(), "foo\n" * 1024)
+
+        with zstd.open(io.BytesIO(), "w") as fh:
+            self.assertEqual(
+                fh._CHUNK_SIZE, zstd.COMPRESSION_RECOMMENDED_INPUT_SIZE
+            )
+
+    def test_pathlike(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = pathlib.Path(td) / "testfile"
+
+            with zstd.open(p, "wb") as fh:
+                fh.write(b"foo" * 1024)
+
+            with zstd.open(p, "rb") as fh:
+                self.assertEqual(fh.read(), b"foo" * 1024)
+
+    def test_invalid_filename(self):
+        with self.assertRaisesRegex(TypeError, "filename must be a str"):
+            zstd.open(42, "rb")
@@ -10,13 +10,81 @@ Python 3.13 has subinterpreter support in the C API but does not expose
 it via the `concurrent.interpreters` module.
 """
 
+import io
 import sys
+import textwrap
 import unittest
 
+import zstandard as zstd
+
 # Python 3.14+ is required for the public concurrent.interpreters module
 if sys.version_info >= (3, 14):
     from concurrent import interpreters  # type: ignore[attr-defined]
 
+# Payloads are built once in the main interpreter and bound into each
+# subinterpreter with prepare_main(), so the exec'd code only measures the
+# compression round trip.
+_ROUND_TRIP_PAYLOADS = (
+    b"",
+    b"Hello, World! ",
+    b"Hello, World! " * 100,
+    b"Goodbye, World! " * 1000,
+)
+_STREAMING_PAYLOAD = b"Streaming test data " * 1000
+_ONE_SHOT_PAYLOAD = b"One-shot test data " * 100
+_PARAMETERS_PAYLOAD = b"Testing compression parameters" * 100
+_DICTIONARY_SAMPLES = tuple(
+    b"sample data " * 10 + bytes([i]) for i in range(100)
+)
+_DICTIONARY_PAYLOAD = b"sample data sample data sample data"
+
+# Code run by tests that execute the same source in many interpreters. It is
+# compiled once and its inputs are bound into the interpreter's __main__
+# module with prepare_main().
+_SEQUENTIAL_CODE = compile(
+    textwrap.dedent(
+        """
+        import zstandard
+
+        cctx = zstandard.ZstdCompressor(level=3)
+        dctx = zstandard.ZstdDecompressor()
+
+        for data in payloads:
+            compressed = cctx.compress(data)
+            decompressed = dctx.decompress(compressed)
+
+            assert decompressed == data, f"Mismatch in interpreter {i}"
+        """
+    ),
+    "<subinterp-sequential>",
+    "exec",
+)
+
+# Worker loop for the interpreter pool in the concurrent test. Work items are
+# read from the ``_tasks`` queue until a ``None`` sentinel is received and
+# completed items are reported on the ``_results`` queue.
+_CONCURRENT_CODE = compile(
+    textwrap.dedent(
+        """
+        import zstandard
+
+        cctx = zstandard.ZstdCompressor(level=1)
+        dctx = zstandard.ZstdDecompressor()
+
+        while (item := _tasks.get()) is not None:
+            for data in payloads:
+                compressed = cctx.compress(data)
+                decompressed = dctx.decompress(compressed)
+
+                assert decompressed == data
+
+            _results.put(item)
+        """
+    ),
+    "<subinterp-concurrent>",
+    "exec",
+)
+
 
 @unittest.skipIf(
     sys.version_info < (3, 14), "concurrent.interpreters requires Python 3.14+"
@@ -39,16 +107,37 @@ class TestSubinterpreters(unittest.TestCase):
             code = """
 import zstandard
 
-# Test basic compression/decompression
-data = b"Hello, World! " * 100
+# Test basic compression/decompression, reusing the contexts
 cctx = zstandard.ZstdCompressor()
-compressed = cctx.compress(data)
-
 dctx = zstandard.ZstdDecompressor()
-decompressed = dctx.decompress(compressed)
 
-assert decompressed == data, "Decompressed data does not match original"
+for data in payloads:
+    compressed = cctx.compress(data)
+    decompressed = dctx.decompress(compressed)
+
+    assert decompressed == data, "Decompressed data does not match original"
 """
+            interp.prepare_main(payloads=_ROUND_TRIP_PAYLOADS)
+            interp.exec(code)
+        finally:
+            interp.close()
+
+    def test_one_shot_in_subinterpreter(self):
+        """Test pooled one-shot compress()/decompress() in a subinterpreter."""
+        interp = interpreters.create()
+        try:
+            code = """
+import zstandard
+
+for level in (1, 3, 1, 3):
+    compressed = zstandard.compress(data, level=level)
+    assert zstandard.decompress(compressed) == data
+
+output = bytearray(len(data))
+size = zstandard.decompress_into(zstandard.compress(data), output)
+assert output[:size] == data
+"""
+            interp.prepare_main(data=_ONE_SHOT_PAYLOAD)
             interp.exec(code)
         finally:
             interp.close()
@@ -58,19 +147,8 @@ assert decompressed == data, "Decompressed data does not match original"
         for i in range(5):
             interp = interpreters.create()
             try:
-                code = f"""
-import zstandard
-
-data = b"Test data for interpreter {i} " * 50
-cctx = zstandard.ZstdCompressor(level=3)
-compressed = cctx.compress(data)
-
-dctx = zstandard.ZstdDecompressor()
-decompressed = dctx.decompress(compressed)
-
-assert decompressed == data, f"Mismatch in interpreter {i}"
-"""
-                interp.exec(code)
+                interp.prepare_main(i=i, payloads=_ROUND_TRIP_PAYLOADS)
+                interp.exec(_SEQUENTIAL_CODE)
             finally:
                 interp.close()
 
@@ -85,7 +163,6 @@ import zstandard
 params = zstandard.ZstdCompressionParameters.from_level(5)
 cctx = zstandard.ZstdCompressor(compression_params=params)
 
-data = b"Testing compression parameters" * 100
 compressed = cctx.compress(data)
 
 dctx = zstandard.ZstdDecompressor()
@@ -93,35 +170,44 @@ decompressed = dctx.decompress(compressed)
 
 assert decompressed == data
 """
+            interp.prepare_main(data=_PARAMETERS_PAYLOAD)
             interp.exec(code)
         finally:
             interp.close()
 
     def test_streaming_api_in_subinterpreter(self):
         """Test streaming compression/decompression in a subinterpreter."""
+        # Reference frame produced by the main interpreter.
+        buffer = io.BytesIO()
+        cctx = zstd.ZstdCompressor()
+        with cctx.stream_writer(buffer, closefd=False) as compressor:
+            compressor.write(_STREAMING_PAYLOAD)
+
         interp = interpreters.create()
         try:
             code = """
 import io
 import zstandard
 
-data = b"Streaming test data " * 1000
-
 # Test stream writer (closefd=False to keep buffer open)
 buffer = io.BytesIO()
 cctx = zstandard.ZstdCompressor()
 with cctx.stream_writer(buffer, closefd=False) as compressor:
     compressor.write(data)
 
+assert buffer.getvalue() == expected_frame
+
 # Test stream reader
-compressed_data = buffer.getvalue()
-read_buffer = io.BytesIO(compressed_data)
+read_buffer = io.BytesIO(expected_frame)
 dctx = zstandard.ZstdDecompressor()
 with dctx.stream_reader(read_buffer) as reader:
     decompressed = reader.read()
 
 assert decompressed == data
 """
+            interp.prepare_main(
+                data=_STREAMING_PAYLOAD, expected_frame=buffer.getvalue()
+            )
             interp.exec(code)
         finally:
             interp.close()
@@ -146,46 +232,55 @@ except zstandard.ZstdError:
             interp.close()
 
     def test_concurrent_subinterpreters(self):
-        """Test zstandard in concurrent subinterpreters."""
+        """Test zstandard in a pool of concurrently running subinterpreters."""
         import threading
 
-        results = []
+        work_items = 10
+        pool = [interpreters.create() for _ in range(4)]
+        tasks = interpreters.create_queue()
+        results = interpreters.create_queue()
         errors = []
 
-        def run_in_subinterpreter(interp_id):
-            try:
-                interp = interpreters.create()
-                try:
-                    code = f"""
-import zstandard
-
-data = b"Concurrent test data for interpreter {interp_id} " * 100
-cctx = zstandard.ZstdCompressor(level=1)
-compressed = cctx.compress(data)
-
-dctx = zstandard.ZstdDecompressor()
-decompressed = dctx.decompress(compressed)
+        for i in range(work_items):
+            tasks.put(i)
+        for _ in pool:
+            tasks.put(None)
 
-assert decompressed == data
-"""
-                    interp.exec(code)
-                    results.append(interp_id)
-                finally:
-                    interp.close()
+        def run_worker(interp):
+            try:
+                interp.exec(_CONCURRENT_CODE)
             except Exception as e:
-                errors.append((interp_id, str(e)))
-
-        threads = []
-        for i in range(10):
-            t = threading.Thread(target=run_in_subinterpreter, args=(i,))
-            threads.append(t)
-            t.start()
+                errors.append(str(e))
 
-        for t in threads:
-            t.join()
+        try:
+            for interp in pool:
+                # Queues can only be bound into interpreters that have
+                # loaded the queue implementation.
+                interp.exec("from concurrent import interpreters")
+                interp.prepare_main(
+                    _tasks=tasks,
+                    _results=results,
+                    payloads=_ROUND_TRIP_PAYLOADS,
+                )
+
+            threads = [
+                threading.Thread(target=run_worker, args=(interp,))
+                for interp in pool
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            # Items put by an interpreter are unbound once it is closed, so
+            # results must be drained first.
+            completed = [results.get_nowait() for _ in range(results.qsize())]
+        finally:
+            for interp in pool:
+                interp.close()
 
         self.assertEqual(len(errors), 0, f"Errors occurred: {errors}")
-        self.assertEqual(len(results), 10)
+        self.assertEqual(sorted(completed), list(range(work_items)))
 
     def test_dictionary_in_subinterpreter(self):
         """Test compression dictionaries in a subinterpreter."""
@@ -194,22 +289,21 @@ assert decompressed == data
             code = """
 import zstandard
 
-# Create training samples
-samples = [b"sample data " * 10 + bytes([i]) for i in range(100)]
-
 # Train a dictionary
-dict_data = zstandard.train_dictionary(8192, samples)
+dict_data = zstandard.train_dictionary(8192, list(samples))
 
 # Use dictionary for compression
 cctx = zstandard.ZstdCompressor(dict_data=dict_data)
 dctx = zstandard.ZstdDecompressor(dict_data=dict_data)
 
-test_data = b"sample data sample data sample data"
 compressed = cctx.compress(test_data)
 decompressed = dctx.decompress(compressed)
 
 assert decompressed == test_data
 """
+            interp.prepare_main(
+                samples=_DICTIONARY_SAMPLES, test_data=_DICTIONARY_PAYLOAD
+            )
             interp.exec(code)
         finally:
             interp.close()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import zstandard as zstd
@@ -13,9 +14,146 @@ class TestCompress(unittest.TestCase):
 
         zstd.compress(b"foobar" * 16384, level=7)
 
+    def test_levels(self):
+        source = b"foobar" * 16384
+
+        for level in (1, 3, 7, 1, 3, 7):
+            self.assertEqual(
+                zstd.compress(source, level=level),
+                zstd.ZstdCompressor(level=level).compress(source),
+            )
+
+    def test_invalid_level(self):
+        with self.assertRaisesRegex(ValueError, "level must be less than"):
+            zstd.compress(b"foobar", level=23)
+
+        self.assertEqual(
+            zstd.decompress(zstd.compress(b"foobar", level=1)), b"foobar"
+        )
+
+    def test_non_int_level(self):
+        zstd.clear_pools()
+        with self.assertRaises(TypeError):
+            zstd.compress(b"foobar", level=3.0)
+
+        zstd.compress(b"foobar", level=3)
+        with self.assertRaises(TypeError):
+            zstd.compress(b"foobar", level=3.0)
+        with self.assertRaises(TypeError):
+            zstd.compress_into(b"foobar", bytearray(64), level=3.0)
+
+    def test_clear_pools(self):
+        zstd.compress(b"foobar")
+        zstd.clear_pools()
+        self.assertEqual(zstd._POOLS, {})
+
+        frame = zstd.compress(b"foobar")
+        self.assertEqual(zstd.decompress(frame), b"foobar")
+
+    def test_pool_bounded(self):
+        zstd.clear_pools()
+
+        cctxs = [
+            zstd._checkout(("cctx", 3)) for _ in range(zstd._POOL_MAX_IDLE * 2)
+        ]
+        for cctx in cctxs:
+            zstd._checkin(("cctx", 3), cctx)
+
+        self.assertEqual(zstd._POOLS["cctx", 3].qsize(), zstd._POOL_MAX_IDLE)
+
+    def test_large_context_not_pooled(self):
+        zstd.clear_pools()
+
+        source = b"".join(b"line %d\n" % i for i in range(200000))
+        self.assertEqual(
+            zstd.decompress(zstd.compress(source, level=12)), source
+        )
+        self.assertNotIn(("cctx", 12), zstd._POOLS)
+
+        zstd.compress(b"foobar", level=12)
+        self.assertEqual(zstd._POOLS["cctx", 12].qsize(), 1)
+
+    def test_threads(self):
+        errors = []
+
+        def worker(i):
+            source = b"thread %d " % i * 4096
+            try:
+                for _ in range(50):
+                    frame = zstd.compress(source, level=i % 3 + 1)
+                    if zstd.decompress(frame) != source:
+                        errors.append(i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+
+
+class TestCompressInto(unittest.TestCase):
+    def test_simple(self):
+        source = b"foobar" * 8192
+        output = bytearray(len(source))
+
+        written = zstd.compress_into(source, output, level=5)
+        self.assertEqual(
+            bytes(output[:written]), zstd.compress(source, level=5)
+        )
+
+    def test_output_too_small(self):
+        with self.assertRaises(zstd.ZstdError):
+            zstd.compress_into(b"foobar" * 8192, bytearray(8))
+
+
+class TestCompressSmall(unittest.TestCase):
+    def test_simple(self):
+        for source in (b"", b"foobar", b"foobar" * 8192):
+            frame = zstd.compress_small(source)
+
+            fp = zstd.get_frame_parameters(frame)
+            self.assertEqual(fp.content_size, len(source))
+            self.assertLessEqual(fp.window_size, 1 << 17)
+            self.assertEqual(zstd.decompress(frame), source)
+
+    def test_pool_not_reachable_from_compress(self):
+        zstd.compress_small(b"foobar")
+
+        for level in ("small", "dctx"):
+            with self.assertRaises(TypeError):
+                zstd.compress(b"foobar", level=level)
+
+    def test_large_input(self):
+        source = b"".join(b"line %d\n" % i for i in range(100000))
+        frame = zstd.compress_small(source)
+
+        self.assertEqual(zstd.get_frame_parameters(frame).window_size, 1 << 17)
+        self.assertEqual(zstd.decompress(frame), source)
+
 
 class TestDecompress(unittest.TestCase):
     def test_simple(self):
         source = b"foobar" * 8192
         frame = zstd.compress(source)
         self.assertEqual(zstd.decompress(frame), source)
+
+    def test_error_reuse(self):
+        with self.assertRaises(zstd.ZstdError):
+            zstd.decompress(b"not a zstd frame")
+
+        source = b"foobar" * 8192
+        self.assertEqual(zstd.decompress(zstd.compress(source)), source)
+
+
+class TestDecompressInto(unittest.TestCase):
+    def test_simple(self):
+        source = b"foobar" * 8192
+        output = bytearray(len(source))
+
+        written = zstd.decompress_into(zstd.compress(source), output)
+        self.assertEqual(written, len(source))
+        self.assertEqual(output, source)
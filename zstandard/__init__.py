@@ -4,7 +4,7 @@
 # This software may be modified and distributed under the terms
 # of the BSD license. See the LICENSE file for details.
 
-# ruff: noqa: F403, F405
+# ruff: noqa: F821
 
 """Python interface to the Zstandard (zstd) compression library."""
 
@@ -12,9 +12,14 @@ from __future__ import absolute_import, unicode_literals
 
 # This module exports the C backend through a central module and implements
 # additional functionality built on top of it.
+import atexit
 import builtins
+import enum
+import importlib
 import io
+import operator
 import os
+import queue
 import sys
 
 if sys.version_info >= (3, 12):
@@ -22,53 +27,211 @@ if sys.version_info >= (3, 12):
 else:
     from typing import ByteString as Buffer
 
-# Import the backend. The behavior can be overridden via environment variable.
-# By default, we try the C backend first, then fall back to Rust if unavailable.
-_module_policy = os.environ.get(
-    "HYPERLIGHT_ZSTANDARD_IMPORT_POLICY",
-    os.environ.get("PYTHON_ZSTANDARD_IMPORT_POLICY", "default"),
-).strip()
-
-backend = None
-
-if _module_policy == "rust":
-    # Explicitly request Rust backend
-    from .backend_rust import *  # type: ignore
-
-    backend = "rust"
-elif _module_policy == "cext":
-    # Explicitly request C backend (no fallback)
-    from .backend_c import *  # type: ignore
+# Names exported by every backend. These are copied into this module's
+# namespace explicitly rather than via ``import *``, which would have to
+# scan the backend module's namespace on every import.
+_BACKEND_EXPORTS = (
+    "BLOCKSIZELOG_MAX",
+    "BLOCKSIZE_MAX",
+    "BufferSegment",
+    "BufferSegments",
+    "BufferWithSegments",
+    "BufferWithSegmentsCollection",
+    "CHAINLOG_MAX",
+    "CHAINLOG_MIN",
+    "COMPRESSION_RECOMMENDED_INPUT_SIZE",
+    "COMPRESSION_RECOMMENDED_OUTPUT_SIZE",
+    "COMPRESSOBJ_FLUSH_BLOCK",
+    "COMPRESSOBJ_FLUSH_FINISH",
+    "CONTENTSIZE_ERROR",
+    "CONTENTSIZE_UNKNOWN",
+    "DECOMPRESSION_RECOMMENDED_INPUT_SIZE",
+    "DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE",
+    "DICT_TYPE_AUTO",
+    "DICT_TYPE_FULLDICT",
+    "DICT_TYPE_RAWCONTENT",
+    "FLUSH_BLOCK",
+    "FLUSH_FRAME",
+    "FORMAT_ZSTD1",
+    "FORMAT_ZSTD1_MAGICLESS",
+    "FRAME_HEADER",
+    "FrameParameters",
+    "HASHLOG_MAX",
+    "HASHLOG_MIN",
+    "LDM_BUCKETSIZELOG_MAX",
+    "LDM_MINMATCH_MAX",
+    "LDM_MINMATCH_MIN",
+    "MAGIC_NUMBER",
+    "MAX_COMPRESSION_LEVEL",
+    "MINMATCH_MAX",
+    "MINMATCH_MIN",
+    "SEARCHLENGTH_MAX",
+    "SEARCHLENGTH_MIN",
+    "SEARCHLOG_MAX",
+    "SEARCHLOG_MIN",
+    "STRATEGY_BTLAZY2",
+    "STRATEGY_BTOPT",
+    "STRATEGY_BTULTRA",
+    "STRATEGY_BTULTRA2",
+    "STRATEGY_DFAST",
+    "STRATEGY_FAST",
+    "STRATEGY_GREEDY",
+    "STRATEGY_LAZY",
+    "STRATEGY_LAZY2",
+    "TARGETLENGTH_MAX",
+    "TARGETLENGTH_MIN",
+    "WINDOWLOG_MAX",
+    "WINDOWLOG_MIN",
+    "ZSTD_VERSION",
+    "ZstdCompressionDict",
+    "ZstdCompressionParameters",
+    "ZstdCompressor",
+    "ZstdDecompressor",
+    "ZstdError",
+    "backend_features",
+    "estimate_decompression_context_size",
+    "frame_content_size",
+    "frame_header_size",
+    "get_frame_parameters",
+    "train_dictionary",
+)
+
+# Names only some backends export.
+_OPTIONAL_BACKEND_EXPORTS = (
+    "ZstdCompressionReader",
+    "ZstdCompressionWriter",
+    "ZstdDecompressionReader",
+    "ZstdDecompressionWriter",
+)
+
+
+def _resolve_backend():
+    """Import the backend selected by the module import policy.
+
+    The behavior can be overridden via environment variable. By default, we
+    try the C backend first, then fall back to Rust if unavailable.
+
+    Returns a ``(name, module)`` tuple.
+    """
+    policy = os.environ.get("HYPERLIGHT_ZSTANDARD_IMPORT_POLICY")
+    if policy is None:
+        policy = os.environ.get("PYTHON_ZSTANDARD_IMPORT_POLICY", "default")
+    policy = policy.strip()
+
+    if policy == "rust":
+        # Explicitly request Rust backend
+        module = importlib.import_module(".backend_rust", __name__)
+
+        return "rust", module
+    elif policy == "cext":
+        # Explicitly request C backend (no fallback)
+        module = importlib.import_module(".backend_c", __name__)
+
+        return "cext", module
+    elif policy == "default":
+        # Default: try C backend first, fall back to Rust if unavailable
+        try:
+            module = importlib.import_module(".backend_c", __name__)
 
-    backend = "cext"
-elif _module_policy == "default":
-    # Default: try C backend first, fall back to Rust if unavailable
-    try:
-        from .backend_c import *  # type: ignore
+            return "cext", module
+        except ImportError:
+            pass
 
-        backend = "cext"
-    except ImportError:
         # C backend not available, try Rust as fallback
         try:
-            from .backend_rust import *  # type: ignore
+            module = importlib.import_module(".backend_rust", __name__)
 
-            backend = "rust"
+            return "rust", module
         except ImportError:
             raise ImportError(
                 "No zstandard backend available. Install the C extension or Rust backend."
             )
-else:
-    raise ImportError(
-        "unknown module import policy: %s; use default, cext, or rust"
-        % _module_policy
-    )
+    else:
+        raise ImportError(
+            "unknown module import policy: %s; use default, cext, or rust"
+            % policy
+        )
+
+
+backend, _backend = _resolve_backend()
+
+globals().update({name: getattr(_backend, name) for name in _BACKEND_EXPORTS})
+globals().update(
+    {
+        name: getattr(_backend, name)
+        for name in _OPTIONAL_BACKEND_EXPORTS
+        if hasattr(_backend, name)
+    }
+)
 
 # Keep this in sync with hyperlight-zstandard.h, rust-ext/src/lib.rs, and debian/changelog.
 __version__ = "0.25.0"
 
-_MODE_CLOSED = 0
-_MODE_READ = 1
-_MODE_WRITE = 2
+
+class _Mode(enum.IntEnum):
+    """Stream modes. Members compare equal to their historical int values."""
+
+    CLOSED = 0
+    READ = 1
+    WRITE = 2
+
+
+_MODE_CLOSED = _Mode.CLOSED
+_MODE_READ = _Mode.READ
+_MODE_WRITE = _Mode.WRITE
+
+# Maps open() modes (with "t" removed) to the (de)compression direction and
+# the mode used to open the underlying file.
+_MODE_TABLE = {
+    "r": ("r", "rb"),
+    "rb": ("r", "rb"),
+    "w": ("w", "wb"),
+    "wb": ("w", "wb"),
+    "a": ("w", "ab"),
+    "ab": ("w", "ab"),
+    "x": ("w", "xb"),
+    "xb": ("w", "xb"),
+}
+
+# Pools of contexts backing the one-shot compress() and decompress() helpers.
+# Allocating a ZSTD_CCtx/ZSTD_DCtx is expensive relative to compressing small
+# inputs, so contexts are reused across calls. A context is checked out of a
+# pool for the duration of a single operation, so concurrent callers never
+# share one. Module state is per-interpreter, so each subinterpreter gets its
+# own pools.
+#
+# Pools are keyed by tuples tagged with the kind of context they hold, so a
+# caller-provided compression level can never select another kind of pool.
+_POOLS: dict[tuple, queue.SimpleQueue] = {}
+_DCTX_POOL_KEY = ("dctx",)
+_SMALL_CCTX_POOL_KEY = ("small",)
+
+# Limits on what the pools retain. A context keeps the workspace of the
+# largest operation it performed, so contexts larger than
+# _POOL_MAX_CONTEXT_SIZE are freed instead of pooled. At most
+# _POOL_MAX_IDLE idle contexts are kept per pool.
+_POOL_MAX_IDLE = 8
+_POOL_MAX_CONTEXT_SIZE = 8 * 1024 * 1024
+
+# Parameters used by compress_small(). These are level 3 with a 128 KiB
+# window and reduced match finder tables, which keeps the compressor's
+# working set small enough to stay in cache.
+_SMALL_COMPRESSION_PARAMS = ZstdCompressionParameters.from_level(  # type: ignore[name-defined]
+    3, window_log=17, chain_log=8, hash_log=15
+)
+
+
+def clear_pools():
+    """Release the contexts pooled by the one-shot functions.
+
+    :py:func:`compress`, :py:func:`decompress` and the other one-shot
+    functions keep a small number of idle contexts for reuse. This frees
+    them. Later calls construct new contexts as needed.
+    """
+    _POOLS.clear()
+
+
+atexit.register(clear_pools)
 
 
 def open(
@@ -80,6 +243,8 @@ def open(
     errors=None,
     newline=None,
     closefd=None,
+    read_size=DECOMPRESSION_RECOMMENDED_INPUT_SIZE,
+    write_size=COMPRESSION_RECOMMENDED_OUTPUT_SIZE,
 ):
     """Create a file object with zstd (de)compression.
 
@@ -111,51 +276,120 @@ def open(
        ``bool`` whether to close the file when the returned object is closed.
         Only used if a file object is passed. If a filename is specified, the
         opened file is always closed when the returned object is closed.
+    :param read_size:
+       ``int`` number of compressed bytes to read from the file at a time
+       when opened for reading. Defaults to zstd's recommended input size
+       for decompression.
+    :param write_size:
+       ``int`` number of compressed bytes to buffer before writing to the
+       file when opened for writing. Defaults to zstd's recommended output
+       size for compression.
     """
     normalized_mode = mode.replace("t", "")
 
-    if normalized_mode in ("r", "rb"):
+    try:
+        open_mode, raw_open_mode = _MODE_TABLE[normalized_mode]
+    except KeyError:
+        raise ValueError("Invalid mode: {!r}".format(mode)) from None
+
+    if open_mode == "r":
         dctx = dctx or ZstdDecompressor()  # type: ignore[name-defined]
-        open_mode = "r"
-        raw_open_mode = "rb"
-    elif normalized_mode in ("w", "wb", "a", "ab", "x", "xb"):
-        cctx = cctx or ZstdCompressor()  # type: ignore[name-defined]
-        open_mode = "w"
-        raw_open_mode = normalized_mode
-        if not raw_open_mode.endswith("b"):
-            raw_open_mode = raw_open_mode + "b"
     else:
-        raise ValueError("Invalid mode: {!r}".format(mode))
+        cctx = cctx or ZstdCompressor()  # type: ignore[name-defined]
 
-    if hasattr(os, "PathLike"):
-        types = (str, bytes, os.PathLike)
-    else:
-        types = (str, bytes)
+    try:
+        path = os.fspath(filename)
+    except TypeError:
+        if not (hasattr(filename, "read") or hasattr(filename, "write")):
+            raise TypeError(
+                "filename must be a str, bytes, file or PathLike object"
+            ) from None
 
-    if isinstance(filename, types):  # type: ignore
-        inner_fh = builtins.open(filename, raw_open_mode)
-        closefd = True
-    elif hasattr(filename, "read") or hasattr(filename, "write"):
         inner_fh = filename
         closefd = bool(closefd)
     else:
-        raise TypeError(
-            "filename must be a str, bytes, file or PathLike object"
+        inner_fh = builtins.open(path, raw_open_mode)
+        closefd = True
+
+    if open_mode == "r":
+        fh = dctx.stream_reader(inner_fh, read_size=read_size, closefd=closefd)
+    else:
+        fh = cctx.stream_writer(
+            inner_fh, write_size=write_size, closefd=closefd
         )
 
+    if "b" in normalized_mode:
+        return fh
+
+    text_fh = io.TextIOWrapper(
+        fh, encoding=encoding, errors=errors, newline=newline
+    )
+
+    # TextIOWrapper exchanges data with the (de)compressor in chunks of
+    # _CHUNK_SIZE bytes (8 KiB by default). Match zstd's recommended stream
+    # sizes so each call into the backend does a meaningful amount of work.
     if open_mode == "r":
-        fh = dctx.stream_reader(inner_fh, closefd=closefd)
-    elif open_mode == "w":
-        fh = cctx.stream_writer(inner_fh, closefd=closefd)
+        text_fh._CHUNK_SIZE = DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE
     else:
-        raise RuntimeError("logic error in zstandard.open() handling open mode")
+        text_fh._CHUNK_SIZE = COMPRESSION_RECOMMENDED_INPUT_SIZE
 
-    if "b" not in normalized_mode:
-        return io.TextIOWrapper(
-            fh, encoding=encoding, errors=errors, newline=newline
+    return text_fh
+
+
+def _new_context(key):
+    """Construct a context for the pool identified by ``key``."""
+    if key == _DCTX_POOL_KEY:
+        return ZstdDecompressor()  # type: ignore[name-defined]
+    elif key == _SMALL_CCTX_POOL_KEY:
+        return ZstdCompressor(  # type: ignore[name-defined]
+            compression_params=_SMALL_COMPRESSION_PARAMS
         )
-    else:
-        return fh
+
+    # Compressor pools for a compression level are keyed by ("cctx", level).
+    return ZstdCompressor(level=key[1])  # type: ignore[name-defined]
+
+
+def _cctx_pool_key(level):
+    """Obtain the pool key for compressors of a compression level.
+
+    The level is normalized first so that values which merely hash equal to
+    an int (e.g. ``3.0``) are rejected whether or not a pool exists for it.
+    """
+    return ("cctx", operator.index(level))
+
+
+def _checkout(key):
+    """Obtain a context from the pool identified by ``key``.
+
+    Compressor pools for a compression level are keyed by
+    ``("cctx", level)``. The caller must pass the context to :py:func:`_checkin` when it is done with it.
+    """
+    try:
+        return _POOLS[key].get_nowait()
+    except (KeyError, queue.Empty):
+        # Constructing the context validates the key (e.g. the compression
+        # level) before a pool is registered for it.
+        return _new_context(key)
+
+
+def _checkin(key, ctx):
+    """Return a context obtained from :py:func:`_checkout` to its pool.
+
+    The context is freed instead if it is too large or the pool is full.
+    """
+    if ctx.memory_size() > _POOL_MAX_CONTEXT_SIZE:
+        return
+
+    pool = _POOLS.get(key)
+
+    if pool is None:
+        pool = _POOLS.setdefault(key, queue.SimpleQueue())
+
+    # qsize() and put() are not atomic together, so threads checking in at
+    # the same time can each see room and overshoot the limit by at most
+    # the number of such threads.
+    if pool.qsize() < _POOL_MAX_IDLE:
+        pool.put(ctx)
 
 
 def compress(data: Buffer, level: int = 3) -> bytes:
@@ -167,13 +401,58 @@ def compress(data: Buffer, level: int = 3) -> bytes:
     This method is provided for convenience and is equivalent to calling
     ``ZstdCompressor(level=level).compress(data)``.
 
-    If you find yourself calling this function in a tight loop,
-    performance will be greater if you construct a single ``ZstdCompressor``
-    and repeatedly call ``compress()`` on it.
+    Compression contexts are pooled per compression level and reused across
+    calls, so calling this function repeatedly does not allocate a new
+    context each time. If you need non-default compression settings,
+    construct a ``ZstdCompressor`` and call ``compress()`` on it.
     """
-    cctx = ZstdCompressor(level=level)  # type: ignore[name-defined]
+    key = _cctx_pool_key(level)
+    cctx = _checkout(key)
+
+    try:
+        return cctx.compress(data)
+    finally:
+        _checkin(key, cctx)
 
-    return cctx.compress(data)
+
+def compress_into(data: Buffer, output: Buffer, level: int = 3) -> int:
+    """Compress source data into a caller-provided buffer.
+
+    This is like :py:func:`compress` except the zstd frame is written to
+    ``output``, which must be a writable bytes-like object (such as a
+    ``bytearray`` or a writable ``memoryview``), instead of a newly
+    allocated ``bytes``.
+
+    Returns the number of bytes written to ``output``. Raises ``ZstdError``
+    if ``output`` is too small to hold the compressed data.
+    """
+    key = _cctx_pool_key(level)
+    cctx = _checkout(key)
+
+    try:
+        return cctx.compress_into(data, output)
+    finally:
+        _checkin(key, cctx)
+
+
+def compress_small(data: Buffer) -> bytes:
+    """Compress small source data using the zstd compression format.
+
+    This is like :py:func:`compress` with the default compression level
+    except the compressor uses a 128 KiB window and smaller match finder
+    tables. This reduces the memory the compressor touches for each call,
+    which makes compressing many small inputs faster. Larger inputs can
+    still be compressed but may compress worse than with :py:func:`compress`.
+
+    The produced frames can be decompressed by any zstd decompressor and
+    require at most a 128 KiB window to decompress.
+    """
+    cctx = _checkout(_SMALL_CCTX_POOL_KEY)
+
+    try:
+        return cctx.compress(data)
+    finally:
+        _checkin(_SMALL_CCTX_POOL_KEY, cctx)
 
 
 def decompress(data: Buffer, max_output_size: int = 0) -> bytes:
@@ -185,10 +464,31 @@ def decompress(data: Buffer, max_output_size: int = 0) -> bytes:
     This method is provided for convenience and is equivalent to calling
     ``ZstdDecompressor().decompress(data, max_output_size=max_output_size)``.
 
-    If you find yourself calling this function in a tight loop, performance
-    will be greater if you construct a single ``ZstdDecompressor`` and
-    repeatedly call ``decompress()`` on it.
+    Decompression contexts are pooled and reused across calls, so calling
+    this function repeatedly does not allocate a new context each time.
     """
-    dctx = ZstdDecompressor()  # type: ignore[name-defined]
+    dctx = _checkout(_DCTX_POOL_KEY)
+
+    try:
+        return dctx.decompress(data, max_output_size=max_output_size)
+    finally:
+        _checkin(_DCTX_POOL_KEY, dctx)
+
+
+def decompress_into(data: Buffer, output: Buffer) -> int:
+    """Decompress a zstd frame into a caller-provided buffer.
 
-    return dctx.decompress(data, max_output_size=max_output_size)
+    This is like :py:func:`decompress` except the decompressed data is
+    written to ``output``, which must be a writable bytes-like object (such
+    as a ``bytearray`` or a writable ``memoryview``). The frame does not
+    need to record its content size.
+
+    Returns the number of bytes written to ``output``. Raises ``ZstdError``
+    if ``output`` is too small to hold the decompressed data.
+    """
+    dctx = _checkout(_DCTX_POOL_KEY)
+
+    try:
+        return dctx.decompress_into(data, output)
+    finally:
+        _checkin(_DCTX_POOL_KEY, dctx)
@@ -207,6 +207,7 @@ class ZstdCompressor:
     ) -> None: ...
     
     def compress(self, data: bytes) -> bytes: ...
+    def compress_into(self, data: Buffer, output: Buffer) -> int: ...
     def compressobj(self, size: int = ...) -> ZstdCompressionObj: ...
     def chunker(
         self,
@@ -324,6 +325,7 @@ class ZstdDecompressor:
         read_across_frames: bool = ...,
         allow_extra_data: bool = ...,
     ) -> bytes: ...
+    def decompress_into(self, data: Buffer, output: Buffer) -> int: ...
     def decompressobj(self, write_size: int = ...) -> ZstdDecompressionObj: ...
     def copy_stream(
         self,
@@ -382,7 +384,13 @@ class ZstdDecompressorIterator:
 
 # Module-level functions
 def compress(data: bytes, level: int = ...) -> bytes: ...
+def compress_into(
+    data: Buffer, output: Buffer, level: int = ...
+) -> int: ...
+def compress_small(data: Buffer) -> bytes: ...
 def decompress(data: bytes, max_output_size: int = ...) -> bytes: ...
+def decompress_into(data: Buffer, output: Buffer) -> int: ...
+def clear_pools() -> None: ...
 def train_dictionary(
     dict_size: int,
     samples: list[bytes],
@@ -410,4 +418,6 @@ def open(
     errors: str = ...,
     newline: str = ...,
     closefd: bool = ...,
+    read_size: int = ...,
+    write_size: int = ...,
 ) -> Union[ZstdCompressionReader, ZstdDecompressionReader, ZstdCompressionWriter, io.TextIOWrapper]: ...